@@ -0,0 +1,506 @@
+"""
+Benchmark suite for the Python hot paths in list/, polynomial/ and postfix/.
+
+Usage:
+    python benchmarks/bench.py run [--sizes 100 1000 ...] [--only NAME ...] [-o results.json]
+    python benchmarks/bench.py compare base.json new.json [--threshold 0.10]
+    python benchmarks/bench.py list
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [10 ** 2, 10 ** 3, 10 ** 4]
+MIN_SIZE, MAX_SIZE = 10 ** 2, 10 ** 6
+DEFAULT_MIN_TIME = 0.2  # Seconds each timed run should last at least
+
+
+def _load(name: str, *path: str):
+    """
+    Load a module from a file in the repo and register it under the given name.
+    The project folders are not packages and some file names contain dashes,
+    so they cannot be imported directly.
+    Parameters:
+        name (str): Module name to register in sys.modules.
+        path (str): Path of the file, relative to the repo root.
+    Returns: The loaded module.
+    """
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, *path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# The modules import instrumentation from the repo root, and
+# sorted-double-linked-list.py imports its siblings by their module names
+sys.path[:0] = [ROOT, os.path.join(ROOT, "list")]
+vsarray = _load("vsarray", "list", "vsarray.py")
+double_linked_list = _load("double_linked_list", "list", "double-linked-list.py")
+sorted_double_linked_list = _load("sorted_double_linked_list", "list", "sorted-double-linked-list.py")
+polynomial = _load("polynomial", "polynomial", "polynomial.py")
+evaluator = _load("evaluator", "postfix", "evaluator.py")
+
+from comparable import Comparable  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+class IntObject(vsarray.Object):
+    """
+    Integer element for VSArray.
+    """
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def Equals(self, other: 'IntObject') -> bool:
+        return self.value == other.value
+
+    def ToString(self) -> str:
+        return str(self.value)
+
+
+class IntItem(Comparable):
+    """
+    Integer element for DoubleLinkedList and SortedDoubleLinkedList.
+    """
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def compare_to(self, other: 'IntItem') -> int:
+        return self.value - other.value
+
+    def equals(self, other: 'IntItem') -> bool:
+        return self.value == other.value
+
+    def copy(self) -> 'IntItem':
+        return IntItem(self.value)
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+def make_vsarray(rng: random.Random, n: int, capacity: int = 10):
+    array = vsarray.VSArray(capacity)
+    for _ in range(n):
+        array.Insert(IntObject(rng.randrange(n)), array._size)
+    return array
+
+
+def make_double_linked_list(rng: random.Random, n: int):
+    dll = double_linked_list.DoubleLinkedList()
+    for _ in range(n):
+        dll.insert(IntItem(rng.randrange(n)), dll._size)
+    return dll
+
+
+def make_sorted_list(rng: random.Random, n: int):
+    # The sorted insert walks from the head, so append the already sorted
+    # values at the tail with the base class insert to keep setup O(n)
+    sdll = sorted_double_linked_list.SortedDoubleLinkedList()
+    for value in sorted(rng.randrange(n) for _ in range(n)):
+        double_linked_list.DoubleLinkedList.insert(sdll, IntItem(value), sdll._size)
+    return sdll
+
+
+def make_polynomial(rng: random.Random, degree: int):
+    coefficients = [rng.uniform(-1.0, 1.0) for _ in range(degree + 1)]
+    # Keep the leading coefficient away from zero so the polynomial can be a divisor
+    coefficients[-1] = rng.choice((-1.0, 1.0)) * rng.uniform(0.5, 1.0)
+    return polynomial.Polynomial(degree, coefficients)
+
+
+def make_postfix(rng: random.Random, n: int) -> str:
+    # n operands chained by "+" and "-" so the result never overflows
+    tokens = [str(rng.randint(1, 9))]
+    for _ in range(n - 1):
+        tokens.append(str(rng.randint(1, 9)))
+        tokens.append(rng.choice("+-"))
+    return " ".join(tokens)
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+class Benchmark:
+    """
+    A named operation measured against inputs of a given size.
+
+    setup(rng, n) builds fresh input outside of the timed region and returns it.
+    run(state) is the timed operation and performs `ops` operations.
+    If run() changes its input, mutates must be True so that every repetition
+    gets fresh input. Sizes above max_size are skipped because the operation
+    is quadratic.
+    """
+
+    def __init__(self, name: str, setup: Callable[[random.Random, int], Any],
+                 run: Callable[[Any], Any], ops: int = 1, max_size: int = MAX_SIZE,
+                 mutates: bool = False):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.ops = ops
+        self.max_size = max_size
+        self.mutates = mutates
+
+
+BATCH = 10  # Operations per timed run for the per-element list benchmarks
+
+
+def _vsarray_insert(array):
+    middle = array._size // 2
+    for i in range(BATCH):
+        array.Insert(IntObject(i), middle)
+
+
+def _make_full_vsarray(rng: random.Random, n: int):
+    # Exactly at capacity, so the next Resize copies all n elements
+    return make_vsarray(rng, n, n)
+
+
+def _vsarray_remove(array):
+    middle = array._size // 2
+    for _ in range(BATCH):
+        array.Remove(middle)
+
+
+def _vsarray_index_of(array):
+    missing = IntObject(-1)  # Never present, so every call scans the whole array
+    for _ in range(BATCH):
+        array.IndexOf(missing)
+
+
+def _dll_get(dll):
+    middle = dll._size // 2
+    for _ in range(BATCH):
+        dll.get(middle)
+
+
+def _dll_insert(dll):
+    middle = dll._size // 2
+    for i in range(BATCH):
+        dll.insert(IntItem(i), middle)
+
+
+def _sorted_insert(state):
+    sdll, values = state
+    for value in values:
+        sdll.insert(IntItem(value))
+
+
+def _polynomial_pair(rng: random.Random, n: int):
+    return make_polynomial(rng, n), make_polynomial(rng, max(1, n // 2))
+
+
+BENCHMARKS: List[Benchmark] = [
+    # Spare capacity keeps Resize out of the insert timings, so sizes are comparable
+    Benchmark("vsarray.insert", lambda rng, n: make_vsarray(rng, n, n + BATCH), _vsarray_insert,
+              ops=BATCH, mutates=True),
+    Benchmark("vsarray.resize", _make_full_vsarray, lambda array: array.Resize(), mutates=True),
+    Benchmark("vsarray.remove", make_vsarray, _vsarray_remove, ops=BATCH, mutates=True),
+    Benchmark("vsarray.index_of", make_vsarray, _vsarray_index_of, ops=BATCH),
+    Benchmark("double_linked_list.get", make_double_linked_list, _dll_get, ops=BATCH),
+    Benchmark("double_linked_list.insert", make_double_linked_list, _dll_insert,
+              ops=BATCH, mutates=True),
+    Benchmark("sorted_double_linked_list.insert",
+              lambda rng, n: (make_sorted_list(rng, n), [rng.randrange(n) for _ in range(BATCH)]),
+              _sorted_insert, ops=BATCH, mutates=True),
+    Benchmark("polynomial.multiply", _polynomial_pair,
+              lambda pair: pair[0].multiply(pair[1]), max_size=10 ** 4),
+    Benchmark("polynomial.divide", _polynomial_pair,
+              lambda pair: pair[0].divide(pair[1]), max_size=10 ** 4),
+    Benchmark("polynomial.evaluate", lambda rng, n: make_polynomial(rng, n),
+              lambda p: p.evaluate(0.999)),
+    Benchmark("postfix.evaluate", make_postfix, evaluator.evaluate),
+]
+
+
+def _time_loops(bench: Benchmark, n: int, seed: int, loops: int) -> float:
+    """
+    Internal helper that times `loops` repetitions of a benchmark.
+    Input that run() changes is rebuilt before each repetition, outside of the
+    timed region. Otherwise one input is built and reused. Like timeit, the
+    garbage collector is disabled while timing so that collections triggered
+    by earlier allocations do not land in the measurement.
+    Returns: Total seconds spent in run().
+    """
+    gc_was_enabled = gc.isenabled()
+    try:
+        gc.collect()
+        gc.disable()
+        if bench.mutates:
+            total = 0.0
+            for i in range(loops):
+                if i and i % 64 == 0:
+                    # Free the linked lists of earlier repetitions, which are cycles
+                    gc.collect()
+                state = bench.setup(random.Random(seed), n)
+                start = time.perf_counter()
+                bench.run(state)
+                total += time.perf_counter() - start
+            return total
+
+        state = bench.setup(random.Random(seed), n)
+        start = time.perf_counter()
+        for _ in range(loops):
+            bench.run(state)
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def calibrate(bench: Benchmark, n: int, seed: int, min_time: float) -> int:
+    """
+    Find how many repetitions make a timed run last at least min_time,
+    trying 1, 2, 5, 10, 20, 50, ... like timeit.Timer.autorange().
+    Returns: The number of repetitions per timed run.
+    """
+    base = 1
+    while True:
+        for factor in (1, 2, 5):
+            loops = base * factor
+            if _time_loops(bench, n, seed, loops) >= min_time:
+                return loops
+        base *= 10
+
+
+def measure(bench: Benchmark, n: int, repeat: int, warmup: int, seed: int,
+            min_time: float = DEFAULT_MIN_TIME) -> Dict[str, Any]:
+    """
+    Time a benchmark at one input size and record its peak memory.
+    Each timed run repeats the operation until it lasts at least min_time, so
+    fast operations are not dominated by timer noise, and reports the time of
+    a single repetition. Input is generated from the same seed every time, so
+    runs that mutate their input are measured against identical data.
+    Parameters:
+        bench (Benchmark): The benchmark to run.
+        n (int): Input size.
+        repeat (int): Number of timed runs.
+        warmup (int): Number of untimed runs before timing.
+        seed (int): Seed for the synthetic data.
+        min_time (float): Minimum seconds per timed run.
+    Returns: A result record for the JSON output.
+    """
+    loops = calibrate(bench, n, seed, min_time)
+    times = []
+    for i in range(warmup + repeat):
+        elapsed = _time_loops(bench, n, seed, loops)
+        if i >= warmup:
+            times.append(elapsed / loops)
+
+    # Memory is traced in a separate run because tracemalloc slows down allocation
+    state = bench.setup(random.Random(seed), n)
+    tracemalloc.start()
+    try:
+        bench.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": bench.name,
+        "size": n,
+        "ops": bench.ops,
+        "loops": loops,
+        "times": times,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "per_op": min(times) / bench.ops,
+        "peak_bytes": peak,
+    }
+
+
+def run_suite(sizes: List[int], names: Optional[List[str]], repeat: int, warmup: int,
+              seed: int, min_time: float = DEFAULT_MIN_TIME, log=sys.stderr) -> Dict[str, Any]:
+    """
+    Run the selected benchmarks at every size.
+    Returns: The full result document with run metadata.
+    """
+    selected = [b for b in BENCHMARKS if not names or b.name in names]
+    results = []
+    skipped = []
+    for bench in selected:
+        for n in sizes:
+            if n > bench.max_size:
+                skipped.append({"name": bench.name, "size": n})
+                print(f"{bench.name:<34} n={n:<8} skipped (max size {bench.max_size})", file=log)
+                continue
+            record = measure(bench, n, repeat, warmup, seed, min_time)
+            results.append(record)
+            print(f"{bench.name:<34} n={n:<8} min {record['min'] * 1e3:10.3f} ms"
+                  f"  peak {record['peak_bytes'] / 1024:10.1f} KiB", file=log)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": repeat,
+            "warmup": warmup,
+            "seed": seed,
+            "min_time": min_time,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compare two result documents by minimum time and peak memory.
+    The minimum is the run least disturbed by other work on the machine. A time
+    increase is only flagged if it exceeds the threshold and is also larger
+    than the combined standard deviation of the two results.
+    Parameters:
+        base (dict): Results from the baseline run.
+        new (dict): Results from the run being checked.
+        threshold (float): Allowed relative increase, e.g. 0.10 for 10%.
+    Returns: One row per benchmark and size present in both documents.
+             Use missing() to find results that are only in the baseline.
+    """
+    base_index = {(r["name"], r["size"]): r for r in base["results"]}
+    rows = []
+    for record in new["results"]:
+        old = base_index.get((record["name"], record["size"]))
+        if old is None:
+            continue
+        time_ratio = record["min"] / old["min"] if old["min"] else math.inf
+        noise = record["stdev"] + old["stdev"]
+        memory_ratio = record["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else 1.0
+        rows.append({
+            "name": record["name"],
+            "size": record["size"],
+            "time_ratio": time_ratio,
+            "memory_ratio": memory_ratio,
+            "slower": time_ratio > 1 + threshold and record["min"] - old["min"] > noise,
+            "more_memory": memory_ratio > 1 + threshold,
+        })
+    return rows
+
+
+def missing(base: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Find baseline results with no matching result in the new run, e.g. because
+    a benchmark crashed or the run used different --only or --sizes options.
+    Returns: The name and size of each missing result.
+    """
+    new_keys = {(r["name"], r["size"]) for r in new["results"]}
+    return [{"name": r["name"], "size": r["size"]} for r in base["results"]
+            if (r["name"], r["size"]) not in new_keys]
+
+
+# Run settings that change the measured data, and settings that only change the machine
+MUST_MATCH = ("seed", "min_time")
+SHOULD_MATCH = ("python", "implementation", "platform")
+
+
+def _size(value: str) -> int:
+    n = int(float(value))  # Accepts "1e4" as well as "10000"
+    if not MIN_SIZE <= n <= MAX_SIZE:
+        raise argparse.ArgumentTypeError(f"size must be between {MIN_SIZE} and {MAX_SIZE}")
+    return n
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and write JSON results")
+    run_parser.add_argument("--sizes", type=_size, nargs="+", default=DEFAULT_SIZES,
+                            help=f"input sizes between {MIN_SIZE} and {MAX_SIZE} (default: %(default)s)")
+    run_parser.add_argument("--only", nargs="+", metavar="NAME",
+                            choices=[b.name for b in BENCHMARKS], help="benchmarks to run")
+    run_parser.add_argument("--repeat", type=int, default=5, help="timed runs (default: %(default)s)")
+    run_parser.add_argument("--warmup", type=int, default=1, help="untimed runs (default: %(default)s)")
+    run_parser.add_argument("--seed", type=int, default=2431, help="data seed (default: %(default)s)")
+    run_parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                            help="minimum seconds per timed run (default: %(default)s)")
+    run_parser.add_argument("-o", "--output", help="result file (default: stdout)")
+
+    compare_parser = commands.add_parser("compare", help="flag slowdowns between two result files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="allowed relative increase (default: %(default)s)")
+
+    commands.add_parser("list", help="list the available benchmarks")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for bench in BENCHMARKS:
+            print(bench.name)
+        return 0
+
+    if args.command == "run":
+        if args.repeat < 1 or args.warmup < 0 or args.min_time < 0:
+            parser.error("--repeat must be at least 1, --warmup and --min-time at least 0")
+        document = run_suite(args.sizes, args.only, args.repeat, args.warmup, args.seed,
+                             args.min_time)
+        if args.output:
+            with open(args.output, "w") as fp:
+                json.dump(document, fp, indent=2)
+        else:
+            json.dump(document, sys.stdout, indent=2)
+            print()
+        return 0
+
+    with open(args.base) as fp:
+        base = json.load(fp)
+    with open(args.new) as fp:
+        new = json.load(fp)
+
+    for key in MUST_MATCH:
+        if base["meta"].get(key) != new["meta"].get(key):
+            print(f"error: runs used different {key}: {base['meta'].get(key)!r} "
+                  f"vs {new['meta'].get(key)!r}", file=sys.stderr)
+            return 2
+    for key in SHOULD_MATCH:
+        if base["meta"].get(key) != new["meta"].get(key):
+            print(f"warning: runs used different {key}: {base['meta'].get(key)!r} "
+                  f"vs {new['meta'].get(key)!r}", file=sys.stderr)
+
+    rows = compare(base, new, args.threshold)
+    absent = missing(base, new)
+    flagged = 0
+    for row in rows:
+        flags = []
+        if row["slower"]:
+            flags.append("SLOWER")
+        if row["more_memory"]:
+            flags.append("MORE MEMORY")
+        flagged += bool(flags)
+        print(f"{row['name']:<34} n={row['size']:<8} time x{row['time_ratio']:6.2f}"
+              f"  memory x{row['memory_ratio']:6.2f}  {' '.join(flags)}")
+    for row in absent:
+        print(f"{row['name']:<34} n={row['size']:<8} MISSING from {args.new}")
+    print(f"{flagged} of {len(rows)} results exceed the {args.threshold:.0%} threshold, "
+          f"{len(absent)} missing")
+    # A non-zero exit status lets scripts fail on regressions and lost results
+    return 1 if flagged or absent else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
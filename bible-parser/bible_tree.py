@@ -0,0 +1,301 @@
+import json
+import re
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Levels of the hierarchy, from the root down to the leaves
+BIBLE, BOOK, CHAPTER, VERSE = "bible", "book", "chapter", "verse"
+
+# Matches a line such as "1 John 3:16 For God so loved..." => (book, chapter, verse, text)
+_VERSE_LINE = re.compile(r"^\s*(.+?)\s+(\d+):(\d+)\s+(.*?)\s*$")
+
+
+class TreeNode:
+    """
+    A single node of the Bible tree. Depending on its level a node represents
+    the Bible itself, a book, a chapter or a verse. Only verses carry text.
+    """
+
+    def __init__(self, level: str, name: str, text: Optional[str] = None):
+        """
+        Initialize a node with no children.
+
+        Parameters:
+            level (str): One of "bible", "book", "chapter" or "verse".
+            name (str): Book name, or the chapter/verse number as a string.
+            text (str, optional): Verse text. Only used by verse nodes.
+        """
+        self.level = level
+        self.name = name
+        self.text = text
+        self.parent: Optional['TreeNode'] = None
+        self.children: List['TreeNode'] = []
+        # Index of children by name so building the tree never scans a child list
+        self._index: Dict[str, 'TreeNode'] = {}
+
+    def child(self, name: str) -> Optional['TreeNode']:
+        """
+        Look up a direct child by name.
+        Parameters: The name of the child (book name, chapter or verse number).
+        Returns: The child node, or None if it does not exist.
+        """
+        return self._index.get(str(name))
+
+    def add_child(self, node: 'TreeNode') -> 'TreeNode':
+        """
+        Append a child node, or return the existing child with the same name.
+        Parameters: The node to add.
+        Returns: The node that is now stored under that name.
+        """
+        existing = self._index.get(node.name)
+        if existing is not None:
+            return existing
+        node.parent = self
+        self.children.append(node)
+        self._index[node.name] = node
+        return node
+
+    def __repr__(self) -> str:
+        return f"TreeNode({self.level!r}, {self.name!r})"
+
+
+class BibleTree:
+    """
+    A tree of books, chapters and verses rooted at a single Bible node.
+    Traversals are generators driven by an explicit stack, so they never hit
+    Python's recursion limit and never build the full list of nodes.
+    """
+
+    def __init__(self, name: str = "Bible"):
+        """
+        Initialize an empty tree.
+        Parameters: The name of the root node. Default is "Bible".
+        """
+        self.root = TreeNode(BIBLE, name)
+
+    def add_verse(self, book: str, chapter: int, verse: int, text: str) -> TreeNode:
+        """
+        Insert a verse, creating its book and chapter nodes as needed.
+        Parameters:
+            book (str): Name of the book.
+            chapter (int): Chapter number.
+            verse (int): Verse number.
+            text (str): Verse text. Replaces the text of an existing verse.
+        Returns: The verse node.
+        """
+        book_node = self.root.add_child(TreeNode(BOOK, book))
+        chapter_node = book_node.add_child(TreeNode(CHAPTER, str(chapter)))
+        verse_node = chapter_node.add_child(TreeNode(VERSE, str(verse)))
+        verse_node.text = text
+        return verse_node
+
+    def parse(self, lines: Iterable[str]) -> int:
+        """
+        Build the tree from lines of the form "Book Chapter:Verse Text".
+        Blank lines are skipped. Lines can come from an open file, so the input
+        does not need to be loaded into memory first.
+        Parameters: Any iterable of strings.
+        Returns: The number of verses added.
+        Raises: ValueError if a non-blank line does not match the format.
+        """
+        count = 0
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            match = _VERSE_LINE.match(line)
+            if not match:
+                raise ValueError(f"line {line_number}: expected 'Book Chapter:Verse Text'")
+            book, chapter, verse, text = match.groups()
+            self.add_verse(book, int(chapter), int(verse), text)
+            count += 1
+        return count
+
+    def find(self, book: Optional[str] = None, chapter: Optional[int] = None) -> Optional[TreeNode]:
+        """
+        Find the subtree for a book, or a chapter within a book.
+        Parameters:
+            book (str, optional): Book name. If omitted, the root is returned.
+            chapter (int, optional): Chapter number. Requires a book.
+        Returns: The matching node, or None if it does not exist.
+        Raises: ValueError if a chapter is given without a book.
+        """
+        if book is None:
+            if chapter is not None:
+                raise ValueError("a chapter can only be selected within a book")
+            return self.root
+        node = self.root.child(book)
+        if node is not None and chapter is not None:
+            node = node.child(str(chapter))
+        return node
+
+    def _start(self, node: Optional[TreeNode]) -> TreeNode:
+        """
+        Internal helper that defaults a traversal to the root.
+        """
+        return self.root if node is None else node
+
+    def preorder(self, node: Optional[TreeNode] = None) -> Iterator[TreeNode]:
+        """
+        Visit each node before its children.
+        Parameters: The subtree to traverse. Default is the whole tree.
+        Returns: A generator of nodes.
+        """
+        stack = [self._start(node)]
+        while stack:
+            current = stack.pop()
+            yield current
+            # Push children in reverse so the first child is visited first
+            stack.extend(reversed(current.children))
+
+    def postorder(self, node: Optional[TreeNode] = None) -> Iterator[TreeNode]:
+        """
+        Visit each node after all of its children.
+        Parameters: The subtree to traverse. Default is the whole tree.
+        Returns: A generator of nodes.
+        """
+        # Each entry holds a node and the index of the next child to descend into
+        stack: List[Tuple[TreeNode, int]] = [(self._start(node), 0)]
+        while stack:
+            current, i = stack[-1]
+            if i < len(current.children):
+                stack[-1] = (current, i + 1)
+                stack.append((current.children[i], 0))
+            else:
+                stack.pop()
+                yield current
+
+    def inorder(self, node: Optional[TreeNode] = None) -> Iterator[TreeNode]:
+        """
+        Visit the first child's subtree, then the node, then the remaining children.
+        This is the usual generalization of inorder traversal to trees with more
+        than two children.
+        Parameters: The subtree to traverse. Default is the whole tree.
+        Returns: A generator of nodes.
+        """
+        stack: List[Tuple[TreeNode, int]] = [(self._start(node), 0)]
+        while stack:
+            current, i = stack[-1]
+            if i == 1 or (i == 0 and not current.children):
+                # The first child (if any) is done, so the node itself comes next
+                yield current
+                if not current.children:
+                    stack.pop()
+                    continue
+            if i < len(current.children):
+                stack[-1] = (current, i + 1)
+                stack.append((current.children[i], 0))
+            else:
+                stack.pop()
+
+    def verses(self, node: Optional[TreeNode] = None) -> Iterator[Tuple[str, str, str, TreeNode]]:
+        """
+        Visit every verse in reading order along with its book and chapter names.
+        Parameters: The subtree to traverse. Default is the whole tree.
+        Returns: A generator of (book, chapter, verse, verse node) tuples.
+        """
+        start = self._start(node)
+        # Label verses below the starting node with the names of its ancestors
+        book = chapter = None
+        ancestor: Optional[TreeNode] = start
+        while ancestor is not None:
+            if ancestor.level == BOOK:
+                book = ancestor.name
+            elif ancestor.level == CHAPTER:
+                chapter = ancestor.name
+            ancestor = ancestor.parent
+
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            if current.level == BOOK:
+                book = current.name
+            elif current.level == CHAPTER:
+                chapter = current.name
+            elif current.level == VERSE:
+                yield book, chapter, current.name, current
+                continue
+            stack.extend(reversed(current.children))
+
+
+def write_json(tree: BibleTree, fp: IO[str], book: Optional[str] = None,
+               chapter: Optional[int] = None, indent: Optional[int] = None) -> None:
+    """
+    Write the tree, or a selected book or chapter, to fp as nested JSON.
+    Output is written node by node, so memory use depends on the depth of the
+    tree rather than its size.
+
+    Each node is written as {"level": ..., "name": ..., "children": [...]};
+    verses have a "text" field instead of "children".
+
+    Parameters:
+        tree (BibleTree): The tree to export.
+        fp (IO[str]): A writable text file object.
+        book (str, optional): Only export this book.
+        chapter (int, optional): Only export this chapter of the book.
+        indent (int, optional): Spaces per nesting level. None writes compact JSON.
+    Raises: KeyError if the selected book or chapter does not exist.
+    """
+    start = tree.find(book, chapter)
+    if start is None:
+        raise KeyError(f"no such subtree: book={book!r}, chapter={chapter!r}")
+
+    def newline(depth: int) -> str:
+        return "" if indent is None else "\n" + " " * (indent * depth)
+
+    sep = ", " if indent is None else ","
+    colon = ": "
+
+    # Each entry holds a node, the index of the next child to write, and its depth
+    stack: List[Tuple[TreeNode, int, int]] = [(start, -1, 0)]
+    while stack:
+        node, i, depth = stack.pop()
+        if i == -1:
+            # Open the object and write its scalar fields
+            fp.write("{" + newline(depth + 1))
+            fp.write(f'"level"{colon}{json.dumps(node.level)}{sep}{newline(depth + 1)}')
+            fp.write(f'"name"{colon}{json.dumps(node.name)}{sep}{newline(depth + 1)}')
+            if node.level == VERSE:
+                fp.write(f'"text"{colon}{json.dumps(node.text)}{newline(depth)}}}')
+                continue
+            fp.write(f'"children"{colon}[')
+            i = 0
+        elif i < len(node.children):
+            fp.write(sep)
+
+        if i < len(node.children):
+            fp.write(newline(depth + 2))
+            stack.append((node, i + 1, depth))
+            stack.append((node.children[i], -1, depth + 2))
+        else:
+            # Close the children array and the object
+            if node.children:
+                fp.write(newline(depth + 1))
+            fp.write("]" + newline(depth) + "}")
+
+
+def write_ndjson(tree: BibleTree, fp: IO[str], book: Optional[str] = None,
+                 chapter: Optional[int] = None) -> int:
+    """
+    Write one JSON object per line for each verse in the tree, or in a
+    selected book or chapter:
+        {"book": "John", "chapter": 3, "verse": 16, "text": "..."}
+    Output is written line by line, so it can be consumed as a stream.
+
+    Parameters:
+        tree (BibleTree): The tree to export.
+        fp (IO[str]): A writable text file object.
+        book (str, optional): Only export this book.
+        chapter (int, optional): Only export this chapter of the book.
+    Returns: The number of verses written.
+    Raises: KeyError if the selected book or chapter does not exist.
+    """
+    start = tree.find(book, chapter)
+    if start is None:
+        raise KeyError(f"no such subtree: book={book!r}, chapter={chapter!r}")
+
+    count = 0
+    for book_name, chapter_name, verse_name, node in tree.verses(start):
+        record = {"book": book_name, "chapter": int(chapter_name),
+                  "verse": int(verse_name), "text": node.text}
+        fp.write(json.dumps(record) + "\n")
+        count += 1
+    return count
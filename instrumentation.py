@@ -0,0 +1,232 @@
+"""
+Opt-in operation counters and timing hooks for the data structures in this repo.
+
+Instrumentation is off by default. While it is off, each instrumented method
+only checks the module-level `enabled` flag, and no method is wrapped for timing.
+
+    import instrumentation
+    instrumentation.enable()
+    ...                                   # use VSArray, DoubleLinkedList, Polynomial, ...
+    instrumentation.dump(sys.stdout)      # one JSON line per snapshot
+    instrumentation.disable()
+
+Counters are kept per (structure, operation) pair:
+    calls, time_ns     - from the timing wrapper around registered methods
+    shifts             - array elements moved to open or close a gap
+    hops               - linked list nodes walked past
+    comparisons        - calls to Equals/equals/compare_to
+    resizes            - array capacity changes
+    copies             - array elements copied into new storage by a resize
+    allocations        - objects created by the operation
+    bytes_allocated    - shallow sys.getsizeof of those objects: a list counts its
+                         slots but not the elements it holds, and a Polynomial
+                         counts itself, its attribute dict and its coefficient list
+"""
+
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import IO, Any, Callable, Dict, List, Tuple
+
+enabled = False
+
+_lock = threading.Lock()
+_totals: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+_hooks: List[Callable[[Dict[str, Any]], None]] = []
+# Registered methods as (class, method name, structure, original function)
+_registry: List[Tuple[type, str, str, Callable]] = []
+# (structure, operation, counts) of the timed calls running on this thread, innermost last
+_calls = threading.local()
+
+
+def enable():
+    """
+    Start counting and wrap every registered method with the timing wrapper.
+    """
+    global enabled
+    if enabled:
+        return
+    enabled = True
+    for cls, name, structure, original in _registry:
+        setattr(cls, name, _timed(original, structure, name))
+
+
+def disable():
+    """
+    Stop counting and restore the original registered methods.
+    Counters keep their values until reset() is called.
+    """
+    global enabled
+    if not enabled:
+        return
+    enabled = False
+    for cls, name, _, original in _registry:
+        setattr(cls, name, original)
+
+
+def reset():
+    """
+    Set every counter back to zero.
+    """
+    with _lock:
+        _totals.clear()
+
+
+def register(cls: type, structure: str, names: List[str]):
+    """
+    Register methods of a class for per-call timing.
+    Only methods defined on the class itself are wrapped, so a subclass must be
+    registered separately for the methods it overrides.
+    Parameters:
+        cls (type): The class that defines the methods.
+        structure (str): Name used for the class in counters, e.g. "vsarray".
+        names (List[str]): Method names. Each is reported as its own operation.
+    """
+    for name in names:
+        original = cls.__dict__[name]
+        _registry.append((cls, name, structure, original))
+        if enabled:
+            setattr(cls, name, _timed(original, structure, name))
+
+
+def record(structure: str, operation: str, **counts: int):
+    """
+    Add to the counters of an operation. Callers check `enabled` first so that
+    nothing is computed while instrumentation is off.
+    The counts are also added to the innermost timed call on this thread, so
+    hooks see the work done during each call.
+    Parameters:
+        structure (str): Name of the data structure.
+        operation (str): Name of the operation.
+        counts (int): Counter names and the amounts to add.
+    """
+    with _lock:
+        _totals[(structure, operation)].update(counts)
+    stack = getattr(_calls, "stack", None)
+    if stack:
+        stack[-1][2].update(counts)
+
+
+def record_in_call(structure: str, fallback: str, **counts: int):
+    """
+    Add to the counters of the innermost timed call on this thread, for work
+    such as allocating a result that belongs to whichever operation asked for it.
+    Callers check `enabled` first, like for record().
+    Parameters:
+        structure (str): Name of the data structure.
+        fallback (str): Operation to count under when no timed call is running,
+                        e.g. when the structure is constructed directly.
+        counts (int): Counter names and the amounts to add.
+    """
+    stack = getattr(_calls, "stack", None)
+    if stack:
+        record(stack[-1][0], stack[-1][1], **counts)
+    else:
+        record(structure, fallback, **counts)
+
+
+def add_hook(callback: Callable[[Dict[str, Any]], None]):
+    """
+    Call a function after every timed call while instrumentation is enabled.
+    The callback receives a dict with "structure", "operation", "elapsed_ns" and
+    "counts" (the counters recorded during that call).
+    Parameters: The callback to add.
+    """
+    _hooks.append(callback)
+
+
+def remove_hook(callback: Callable[[Dict[str, Any]], None]):
+    """
+    Remove a callback added with add_hook().
+    Parameters: The callback to remove.
+    Raises: ValueError if the callback was not added.
+    """
+    _hooks.remove(callback)
+
+
+def _timed(func: Callable, structure: str, operation: str) -> Callable:
+    """
+    Internal helper that wraps a method to count and time its calls.
+    """
+    def wrapper(*args, **kwargs):
+        stack = getattr(_calls, "stack", None)
+        if stack is None:
+            stack = _calls.stack = []
+        counts: Counter = Counter()
+        stack.append((structure, operation, counts))
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            stack.pop()
+            with _lock:
+                _totals[(structure, operation)].update(calls=1, time_ns=elapsed)
+            if _hooks:
+                event = {"structure": structure, "operation": operation,
+                         "elapsed_ns": elapsed, "counts": dict(counts)}
+                for hook in list(_hooks):
+                    hook(event)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Take a copy of all counters.
+    Returns: A dict with a Unix "timestamp" and a "metrics" list holding one
+             entry per (structure, operation) with its counters.
+    """
+    with _lock:
+        items = sorted((key, dict(counter)) for key, counter in _totals.items())
+    metrics = [{"structure": structure, "operation": operation, **counters}
+               for (structure, operation), counters in items]
+    return {"timestamp": time.time(), "metrics": metrics}
+
+
+def _label(value: str) -> str:
+    """
+    Internal helper that escapes a Prometheus label value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def dump(fp: IO[str], format: str = "json"):
+    """
+    Write a snapshot of all counters to fp.
+    Parameters:
+        fp (IO[str]): A writable text file object.
+        format (str): "json" writes the snapshot as a single line, so repeated
+                      dumps to the same file form NDJSON. "prometheus" writes
+                      the Prometheus text exposition format, with every counter
+                      as a ds_<name>_total counter and time_ns converted to
+                      ds_time_seconds_total.
+    Raises: ValueError for an unknown format.
+    """
+    data = snapshot()
+    if format == "json":
+        fp.write(json.dumps(data) + "\n")
+    elif format == "prometheus":
+        timestamp_ms = int(data["timestamp"] * 1000)
+        # Samples of one metric must be written together after its TYPE line
+        families: Dict[str, List[str]] = defaultdict(list)
+        for metric in data["metrics"]:
+            labels = (f'structure="{_label(metric["structure"])}",'
+                      f'operation="{_label(metric["operation"])}"')
+            for name, value in metric.items():
+                if name in ("structure", "operation"):
+                    continue
+                if name == "time_ns":
+                    name, value = "time_seconds", value / 1e9
+                families[f"ds_{name}_total"].append(f"{{{labels}}} {value} {timestamp_ms}")
+        for family in sorted(families):
+            fp.write(f"# TYPE {family} counter\n")
+            for sample in families[family]:
+                fp.write(f"{family}{sample}\n")
+    else:
+        raise ValueError(f"unknown format: {format!r}")
@@ -0,0 +1,27 @@
+class Comparable:
+    """
+    Interface for objects stored in SortedDoubleLinkedList.
+    """
+
+    def compare_to(self, other: 'Comparable') -> int:
+        """
+        Compare this object with another object.
+        Parameters: The object to compare with.
+        Returns: A negative number if this object is smaller, 0 if equal, a positive number if larger.
+        """
+        raise NotImplementedError()
+
+    def equals(self, other: 'Comparable') -> bool:
+        """
+        Compare this object with another object for equality.
+        Parameters: The object to compare with.
+        Returns: True if equal, otherwise False.
+        """
+        return self.compare_to(other) == 0
+
+    def copy(self) -> 'Comparable':
+        """
+        Create a copy of the object.
+        Returns: A new object equal to this one.
+        """
+        raise NotImplementedError()
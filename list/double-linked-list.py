@@ -1,3 +1,12 @@
+import sys
+
+try:
+    import instrumentation
+except ImportError:
+    from types import SimpleNamespace
+    instrumentation = SimpleNamespace(enabled=False, register=lambda *args: None)
+
+
 class Node:
     def __init__(self, data, prev=None, next=None):
         # Node stores the actual data and pointers to the previous and next nodes in the list
@@ -57,6 +66,11 @@ class DoubleLinkedList:
             return False
 
         new_node = Node(element)
+        if instrumentation.enabled:
+            # Only a middle insertion walks the list
+            hops = position if 0 < position < self._size else 0
+            instrumentation.record("double_linked_list", "insert", hops=hops, allocations=1,
+                                   bytes_allocated=sys.getsizeof(new_node))
 
         if self._size == 0:
             # Insert into an empty list
@@ -101,10 +115,16 @@ class DoubleLinkedList:
 
         while current:
             if current.data.equals(element):
+                if instrumentation.enabled:
+                    instrumentation.record("double_linked_list", "index_of",
+                                           hops=index, comparisons=index + 1)
                 return index
             current = current.next
             index += 1
 
+        if instrumentation.enabled:
+            instrumentation.record("double_linked_list", "index_of",
+                                   hops=index, comparisons=index)
         return -1
 
     def remove(self, position: int):
@@ -136,6 +156,8 @@ class DoubleLinkedList:
 
         else:
             # Remove from middle
+            if instrumentation.enabled:
+                instrumentation.record("double_linked_list", "remove", hops=position)
             tmp = self._head
             for _ in range(position):
                 tmp = tmp.next
@@ -154,6 +176,9 @@ class DoubleLinkedList:
         if position >= self._size or position < 0:
             return None
 
+        if instrumentation.enabled:
+            instrumentation.record("double_linked_list", "get", hops=position)
+
         current = self._head
         for _ in range(position):
             current = current.next
@@ -184,4 +209,7 @@ class DoubleLinkedList:
 
         self._head = None
         self._tail = None
-        self._size = 0
\ No newline at end of file
+        self._size = 0
+
+
+instrumentation.register(DoubleLinkedList, "double_linked_list", ["insert", "index_of", "remove", "get"])
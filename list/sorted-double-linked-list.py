@@ -1,3 +1,11 @@
+import sys
+
+try:
+    import instrumentation
+except ImportError:
+    from types import SimpleNamespace
+    instrumentation = SimpleNamespace(enabled=False, register=lambda *args: None)
+
 from double_linked_list import DoubleLinkedList, Node
 from comparable import Comparable  # Interface that requires compare_to method
 
@@ -37,29 +45,46 @@ class SortedDoubleLinkedList(DoubleLinkedList):
 
             # Traverse until we find the insertion point
             # We stop at the first node whose data is not less than the new element
-            while tmp and element.compare_to(tmp.data) > 0:
-                tmp = tmp.next
+            if not instrumentation.enabled:
+                while tmp and element.compare_to(tmp.data) > 0:
+                    tmp = tmp.next
+            else:
+                # Same walk, counting hops only when instrumentation is on
+                hops = 0
+                while tmp and element.compare_to(tmp.data) > 0:
+                    tmp = tmp.next
+                    hops += 1
+                # Every hop follows one comparison, plus the one that stopped the walk
+                instrumentation.record("sorted_double_linked_list", "insert", hops=hops,
+                                       comparisons=hops + (1 if tmp else 0))
 
             if not tmp:
                 # Case 2: Reached the end of the list => insert at the tail
-                neo.previous = self._tail
+                neo.prev = self._tail
                 self._tail.next = neo
                 self._tail = neo
 
-            elif not tmp.previous:
+            elif not tmp.prev:
                 # Case 3: Inserting before the current head => insert at the beginning
                 neo.next = self._head
-                self._head.previous = neo
+                self._head.prev = neo
                 self._head = neo
 
             else:
                 # Case 4: Inserting somewhere in the middle
-                # Connect neo between tmp.previous and tmp
-                neo.previous = tmp.previous
+                # Connect neo between tmp.prev and tmp
+                neo.prev = tmp.prev
                 neo.next = tmp
-                tmp.previous.next = neo
-                tmp.previous = neo
+                tmp.prev.next = neo
+                tmp.prev = neo
+
+        if instrumentation.enabled:
+            instrumentation.record("sorted_double_linked_list", "insert", allocations=1,
+                                   bytes_allocated=sys.getsizeof(neo))
 
         # Increase the size of the list after successful insertion
         self._size += 1
-        return True
\ No newline at end of file
+        return True
+
+
+instrumentation.register(SortedDoubleLinkedList, "sorted_double_linked_list", ["insert"])
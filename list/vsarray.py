@@ -1,5 +1,12 @@
+import sys
 from typing import Optional, List
 
+try:
+    import instrumentation
+except ImportError:
+    from types import SimpleNamespace
+    instrumentation = SimpleNamespace(enabled=False, register=lambda *args: None)
+
 class Object:
     """
     Abstract base class for all objects stored in VSArray.
@@ -84,6 +91,9 @@ class VSArray:
             new_capacity = self._capacity + int(self._delta)
 
         new_data = self._data[:self._size] + [None] * (new_capacity - self._size)
+        if instrumentation.enabled:
+            instrumentation.record("vsarray", "Resize", resizes=1, copies=self._size,
+                                   allocations=1, bytes_allocated=sys.getsizeof(new_data))
         self._data = new_data
         self._capacity = new_capacity
 
@@ -99,6 +109,9 @@ class VSArray:
         if self._size == self._capacity:
             self.Resize()
 
+        if instrumentation.enabled:
+            instrumentation.record("vsarray", "Insert", shifts=self._size - position)
+
         # Extend size and shift elements to the right
         self._data[self._size:self._size + 1] = [None]
         for i in range(self._size, position, -1):
@@ -118,7 +131,11 @@ class VSArray:
             return -1
         for i in range(self._size):
             if self._data[i] and self._data[i].Equals(element):
+                if instrumentation.enabled:
+                    instrumentation.record("vsarray", "IndexOf", comparisons=i + 1)
                 return i
+        if instrumentation.enabled:
+            instrumentation.record("vsarray", "IndexOf", comparisons=self._size)
         return -1
 
     def Remove(self, position: int) -> Optional[Object]:
@@ -131,6 +148,8 @@ class VSArray:
             return None
 
         removed = self._data[position]
+        if instrumentation.enabled:
+            instrumentation.record("vsarray", "Remove", shifts=self._size - 1 - position)
 
         # Shift elements left
         for i in range(position, self._size - 1):
@@ -172,4 +191,7 @@ class VSArray:
         Get the current capacity of the array.
         Returns: Capacity of internal array.
         """
-        return self._capacity
\ No newline at end of file
+        return self._capacity
+
+
+instrumentation.register(VSArray, "vsarray", ["Resize", "Insert", "IndexOf", "Remove", "Get"])
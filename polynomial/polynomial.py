@@ -1,5 +1,12 @@
 from typing import List, Tuple
 import math
+import sys
+
+try:
+    import instrumentation
+except ImportError:
+    from types import SimpleNamespace
+    instrumentation = SimpleNamespace(enabled=False, register=lambda *args: None)
 
 
 class Polynomial:
@@ -21,13 +28,42 @@ class Polynomial:
             self._coefficients = [0.0] * (degree + 1)
         else:
             self._coefficients = coefficients[:degree + 1]
+        if instrumentation.enabled:
+            self._record_allocation()
+
+    @classmethod
+    def _from_coefficients(cls, degree: int, coefficients: List[float]) -> 'Polynomial':
+        """
+        Internal constructor for results of operations. Takes ownership of a
+        coefficient list the operation just built, instead of copying it like __init__.
+        Parameters:
+            degree (int): The degree of the polynomial.
+            coefficients (List[float]): Exactly degree + 1 coefficients, not shared with anyone else.
+        Returns: The new polynomial.
+        """
+        result = cls.__new__(cls)
+        result._degree = degree
+        result._coefficients = coefficients
+        if instrumentation.enabled:
+            result._record_allocation()
+        return result
+
+    def _record_allocation(self):
+        """
+        Internal helper that counts a new polynomial under the operation that
+        created it, e.g. multiply, or under __init__ when constructed directly.
+        bytes_allocated covers the object, its attribute dict and its coefficient
+        list, but not the float values in the list.
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.__dict__) + sys.getsizeof(self._coefficients)
+        instrumentation.record_in_call("polynomial", "__init__", allocations=1, bytes_allocated=size)
 
     def copy(self) -> 'Polynomial':
         """
         Create a deep copy of the polynomial.
         Returns: A new polynomial with the same coefficients and degree.
         """
-        return Polynomial(self._degree, self._coefficients.copy())
+        return Polynomial._from_coefficients(self._degree, self._coefficients.copy())
 
     def __eq__(self, other: 'Polynomial') -> bool:
         """
@@ -51,7 +87,7 @@ class Polynomial:
             rhs_val = rhs._coefficients[i] if i <= rhs._degree else 0.0
             result_coeffs[i] = lhs_val + rhs_val
 
-        return Polynomial(big_degree, result_coeffs)
+        return Polynomial._from_coefficients(big_degree, result_coeffs)
 
     def subtract(self, rhs: 'Polynomial') -> 'Polynomial':
         """
@@ -67,7 +103,7 @@ class Polynomial:
             rhs_val = rhs._coefficients[i] if i <= rhs._degree else 0.0
             result_coeffs[i] = lhs_val - rhs_val
 
-        return Polynomial(big_degree, result_coeffs)
+        return Polynomial._from_coefficients(big_degree, result_coeffs)
 
     def minus(self) -> 'Polynomial':
         """
@@ -75,7 +111,7 @@ class Polynomial:
         Returns: The negated polynomial (-1 * this).
         """
         result_coeffs = [-c for c in self._coefficients]
-        return Polynomial(self._degree, result_coeffs)
+        return Polynomial._from_coefficients(self._degree, result_coeffs)
 
     def multiply(self, rhs: 'Polynomial') -> 'Polynomial':
         """
@@ -90,7 +126,7 @@ class Polynomial:
             for j in range(rhs._degree + 1):
                 result_coeffs[i + j] += self._coefficients[i] * rhs._coefficients[j]
 
-        return Polynomial(new_degree, result_coeffs)
+        return Polynomial._from_coefficients(new_degree, result_coeffs)
 
     def divide(self, rhs: 'Polynomial') -> 'Polynomial':
         """
@@ -116,7 +152,7 @@ class Polynomial:
         Returns: Tuple[Polynomial, Polynomial]: (quotient, remainder)
         """
         if rhs._degree > self._degree:
-            return Polynomial(0, [0.0]), self.copy()
+            return Polynomial._from_coefficients(0, [0.0]), self.copy()
 
         degree_diff = self._degree - rhs._degree
         quo_coeffs = [0.0] * (degree_diff + 1)
@@ -128,7 +164,8 @@ class Polynomial:
             for j in range(rhs._degree + 1):
                 remainder[i + j] -= coeff * rhs._coefficients[j]
 
-        return Polynomial(degree_diff, quo_coeffs), Polynomial(len(remainder) - 1, remainder)
+        return (Polynomial._from_coefficients(degree_diff, quo_coeffs),
+                Polynomial._from_coefficients(len(remainder) - 1, remainder))
 
     def derive(self) -> 'Polynomial':
         """
@@ -136,10 +173,10 @@ class Polynomial:
         Returns: The first derivative of the polynomial.
         """
         if self._degree == 0:
-            return Polynomial(0, [0.0])
+            return Polynomial._from_coefficients(0, [0.0])
 
         derived_coeffs = [(i + 1) * self._coefficients[i + 1] for i in range(self._degree)]
-        return Polynomial(self._degree - 1, derived_coeffs)
+        return Polynomial._from_coefficients(self._degree - 1, derived_coeffs)
 
     def evaluate(self, x: float) -> float:
         """
@@ -197,4 +234,9 @@ class Polynomial:
         Write polynomial data as a string.
         Returns: A string starting with degree, followed by coefficients.
         """
-        return f"{self._degree} " + ' '.join(f"{c:.2f}" for c in self._coefficients)
\ No newline at end of file
+        return f"{self._degree} " + ' '.join(f"{c:.2f}" for c in self._coefficients)
+
+
+instrumentation.register(Polynomial, "polynomial", ["sum", "subtract", "minus", "multiply", "divide",
+                                                    "divide_with_remainder", "derive", "evaluate",
+                                                    "integrate"])